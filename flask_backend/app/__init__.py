@@ -1,44 +1,103 @@
 import os
+import sys
 import logging
 import json
-from flask import Flask
-from flask_cors import CORS
+from datetime import datetime, timezone
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_smorest import Api
 
+from .services.supabase_client import get_supabase
+
 # Import blueprints
 from .routes.health import blp as health_blp
 from .routes.hello import blp as hello_blp
-from .routes.movies import blp as movies_blp
+from .routes.movies import blp as movies_blp, CompressedMoviesCache, compress_cache_key
+
+# Prefer orjson for log encoding; fall back to the stdlib encoder when unavailable
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dumps(payload: dict) -> str:
+    """Serialize a log payload to a JSON string using the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode()
+    return json.dumps(payload, default=str)
+
+
+# Structured fields that callers may attach via ``extra=``
+_EXTRA_KEYS = ("event", "context", "request_id")
 
-# Simple JSON formatter for structured logs (no external dependencies)
+
+# Simple JSON formatter for structured logs
 class JSONFormatter(logging.Formatter):
+    """Render log records as single-line JSON objects.
+
+    Source location (pathname/lineno) is only emitted when ``include_location`` is set,
+    which the app enables when logging at DEBUG level.
+    """
+
+    def __init__(self, *args, include_location: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.include_location = include_location
+
     def format(self, record: logging.LogRecord) -> str:
         payload = {
             "level": record.levelname,
             "name": record.name,
-            "message": record.getMessage(),
-            "time": self.formatTime(record, self.datefmt),
+            # Only %-format when there is something to interpolate
+            "message": record.getMessage() if record.args else str(record.msg),
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
         }
         # Add location
-        payload["pathname"] = record.pathname
-        payload["lineno"] = record.lineno
-        # Include exception text when present
+        if self.include_location:
+            payload["pathname"] = record.pathname
+            payload["lineno"] = record.lineno
+        # Include exception text when present, formatting the traceback once per record
         if record.exc_info:
-            payload["exc_info"] = self.formatException(record.exc_info)
-        # Attach extra dict-like attributes if provided via LoggerAdapter or extra
-        for key in ("event", "context", "request_id"):
-            if hasattr(record, key):
-                payload[key] = getattr(record, key)
-        return json.dumps(payload)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            payload["exc_info"] = record.exc_text
+        # Attach structured fields passed via LoggerAdapter or extra; the message itself is
+        # only %-formatted here, so filtered-out records never pay for serialization
+        record_dict = record.__dict__
+        for key in _EXTRA_KEYS:
+            if key in record_dict:
+                payload[key] = record_dict[key]
+        return _dumps(payload)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that renders responses and parses request bodies with orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        # Used by request.get_json(); content-type checks stay in Werkzeug's Request
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
 app.url_map.strict_slashes = False
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Configure structured JSON logging
 log_level = os.getenv("FLASK_LOG_LEVEL", "INFO").upper()
 handler = logging.StreamHandler()
-handler.setFormatter(JSONFormatter())
-# Configure app logger
+handler.setFormatter(JSONFormatter(include_location=log_level == "DEBUG"))
+# Configure app logger; module loggers such as "app.movies" and "app.supabase" are its
+# children, so they inherit this level and propagate records to this handler
 app.logger.handlers.clear()
 app.logger.addHandler(handler)
 app.logger.setLevel(log_level)
@@ -52,34 +111,68 @@ root_logger.setLevel(log_level)
 has_supabase_url = bool(os.getenv("SUPABASE_URL"))
 has_supabase_service_key = bool(os.getenv("SUPABASE_SERVICE_KEY"))
 app.logger.info(
-    json.dumps({
+    "startup",
+    extra={
         "event": "startup",
-        "component": "flask_app",
-        "supabase_env": {"has_url": has_supabase_url, "has_service_key": has_supabase_service_key},
-    })
+        "context": {
+            "component": "flask_app",
+            "supabase_env": {"has_url": has_supabase_url, "has_service_key": has_supabase_service_key},
+        },
+    },
 )
 
+# Create the Supabase client up front so request handlers only read the singleton.
+# Failure is not fatal at startup; routes retry and report configuration errors as 500s.
+try:
+    get_supabase()
+except RuntimeError:
+    app.logger.warning(
+        "supabase_eager_init_failed",
+        extra={"event": "supabase_eager_init_failed"},
+    )
+
 # Configure CORS to allow React dev server, preview origin, and optional deployed FRONTEND_URL
-# - Credentials remain disabled (default False)
-# - Preflight (OPTIONS) will be handled by flask-cors automatically
-allowed_origins = [
-    "http://localhost:3000",
-    "http://127.0.0.1:3000",
-    "https://vscode-internal-19007-beta.beta01.cloud.kavia.ai:3000",
-    "https://kavia-bootcamp-movie-application.kavia.app/"
-]
-
-CORS(
-    app,
-    resources={
-        r"/*": {
-            "origins": allowed_origins,
-            "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-            "allow_headers": ["Content-Type", "Authorization"],
-            "supports_credentials": False,
-        }
-    },
+# - Credentials remain disabled (no Access-Control-Allow-Credentials header is sent)
+# - Preflight (OPTIONS) responses from Flask's automatic OPTIONS handling get the fixed
+#   allowed methods/headers below
+# Origins are normalized the way browsers send them (lowercase, no trailing slash) and
+# interned so the per-request membership test is a hash plus pointer compare.
+allowed_origins = frozenset(
+    sys.intern(origin.lower().rstrip("/"))
+    for origin in (
+        "http://localhost:3000",
+        "http://127.0.0.1:3000",
+        "https://vscode-internal-19007-beta.beta01.cloud.kavia.ai:3000",
+        "https://kavia-bootcamp-movie-application.kavia.app/",
+    )
 )
+_CORS_ALLOW_METHODS = "GET, POST, PUT, DELETE, OPTIONS, PATCH"
+_CORS_ALLOW_HEADERS = "Content-Type, Authorization"
+
+
+@app.after_request
+def _apply_cors(response):
+    """Echo allowed origins with a single set lookup instead of per-request regex matching."""
+    origin = request.headers.get("Origin")
+    if origin in allowed_origins:
+        headers = response.headers
+        headers["Access-Control-Allow-Origin"] = origin
+        if request.method == "OPTIONS":
+            headers["Access-Control-Allow-Methods"] = _CORS_ALLOW_METHODS
+            headers["Access-Control-Allow-Headers"] = _CORS_ALLOW_HEADERS
+    response.vary.add("Origin")
+    return response
+
+# Compress JSON responses for clients that accept it; small bodies are sent as-is.
+# Responses built from bytes carry Content-Length for the size check. gzip is pinned to
+# keep CPU cost predictable, and the cached movies list is compressed once per cache fill
+# through the Flask-Compress cache backend rather than on every hit.
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+app.config["COMPRESS_MIN_SIZE"] = 512
+app.config["COMPRESS_ALGORITHM"] = "gzip"
+app.config["COMPRESS_CACHE_BACKEND"] = CompressedMoviesCache
+app.config["COMPRESS_CACHE_KEY"] = compress_cache_key
+Compress(app)
 
 # OpenAPI/Docs configuration
 app.config["API_TITLE"] = "My Flask API"
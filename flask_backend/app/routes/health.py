@@ -1,10 +1,13 @@
 from flask_smorest import Blueprint
-from flask.views import MethodView
+from flask import Response
 
 blp = Blueprint("Healt Check", "health check", url_prefix="/", description="Health check route")
 
+# Pre-encoded body; probes hit this often, so skip MethodView dispatch and JSON encoding.
+# A fresh Response is still built per call because after_request hooks (CORS) mutate headers.
+_HEALTH_BODY = b'{"message": "Healthy, and updated :)"}'
+
 
 @blp.route("/")
-class HealthCheck(MethodView):
-    def get(self):
-        return {"message": "Healthy, and updated :)"}
+def health_check():
+    return Response(_HEALTH_BODY, status=200, mimetype="application/json")
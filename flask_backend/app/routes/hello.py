@@ -10,10 +10,14 @@ blp = Blueprint(
     description="Basic hello endpoint for connectivity checks",
 )
 
+# Pre-encoded body; a fresh Response is still built per call because
+# after_request hooks (CORS) mutate response headers
+_HELLO_BODY = b"Hello from Flask"
+
 @blp.route("/hello")
 class HelloView(MethodView):
     # PUBLIC_INTERFACE
     def get(self):
         """Return a plain text greeting for connectivity test."""
         # Return plain text as per acceptance criteria
-        return Response("Hello from Flask", mimetype="text/plain", status=200)
+        return Response(_HELLO_BODY, mimetype="text/plain", status=200)
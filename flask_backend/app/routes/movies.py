@@ -1,11 +1,23 @@
-import json
-from flask_smorest import Blueprint
+import functools
+import logging
+import os
+import re
+import threading
+import time
+from typing import Annotated, Union
+
+import msgspec
+from flask_smorest import Blueprint, abort
 from flask.views import MethodView
 from marshmallow import Schema, fields, validate
-from flask import current_app
+from flask import Response, g, request
+from werkzeug.exceptions import HTTPException
 
 from app.services.supabase_client import get_supabase
 
+# Child of the Flask app logger ("app"); inherits its level and JSON handler
+_logger = logging.getLogger("app.movies")
+
 
 # Schemas for request/response validation and documentation
 class MovieSchema(Schema):
@@ -24,6 +36,40 @@ class MovieCreateSchema(Schema):
     photo_url = fields.Str(allow_none=True, description="Poster image URL for the movie")
 
 
+# Compiled request validator; MovieCreateSchema above is kept for OpenAPI docs only.
+# Fields left out of the body stay UNSET so they are omitted from the insert payload.
+class MovieCreate(msgspec.Struct, forbid_unknown_fields=True):
+    title: Annotated[str, msgspec.Meta(min_length=1)]
+    year: Union[int, str, None, msgspec.UnsetType] = msgspec.UNSET
+    overview: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+    photo_url: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+
+    def __post_init__(self):
+        # Like marshmallow's Int field, accept integer strings such as "2010" (but not "1e3" or "null")
+        if isinstance(self.year, str):
+            try:
+                self.year = int(self.year)
+            except ValueError:
+                raise ValueError("Invalid field `year`: not a valid integer.") from None
+
+
+# Insert errors that suggest the photo_url column is missing, matched in a single pass
+_MISSING_COLUMN_RE = re.compile(r"column|unknown|invalid input|does not exist|undefined", re.IGNORECASE)
+
+
+# Field name in msgspec validation messages, e.g. "Object missing required field `title`"
+# or "Expected `int`, got `str` - at `$.year`"
+_FIELD_ERROR_RE = re.compile(r"field `(\w+)`|at `\$\.(\w+)`")
+
+
+# Sorted field names of MovieCreate, used for payload key diagnostics in logs
+_MOVIE_CREATE_KEYS = tuple(sorted(MovieCreate.__struct_fields__))
+
+
+# Built once at import; reused for every list response
+_MOVIE_LIST_SCHEMA = MovieSchema(many=True)
+
+
 # Define blueprint for Movies endpoints
 blp = Blueprint(
     "Movies",
@@ -33,10 +79,159 @@ blp = Blueprint(
 )
 
 
+def _json_errors(message: str) -> dict:
+    """Shape a validation message like webargs' ``errors`` payload: {"json": {field: [msg]}}."""
+    match = _FIELD_ERROR_RE.search(message)
+    field = (match.group(1) or match.group(2)) if match else "_schema"
+    return {"json": {field: [message]}}
+
+
+def use_msgspec(struct_type):
+    """Decode and validate the JSON request body against a msgspec Struct.
+
+    The view receives the provided fields as a dict, matching what
+    ``@blp.arguments`` passes after a marshmallow load. Decoding is strict (no implicit
+    string coercion); any lenient parsing the old schema allowed lives on the Struct.
+    Responds with 422 when the body is not JSON or fails validation.
+    """
+    decoder = msgspec.json.Decoder(struct_type)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not request.is_json:
+                abort(422, errors=_json_errors("Request body must be JSON (Content-Type: application/json)."))
+            try:
+                parsed = decoder.decode(request.get_data())
+            except (msgspec.ValidationError, msgspec.DecodeError) as exc:
+                abort(422, errors=_json_errors(str(exc)))
+            return func(*args, msgspec.to_builtins(parsed), **kwargs)
+        return wrapper
+    return decorator
+
+
+# Short-lived in-process cache of the encoded movies list (seconds; 0 disables it).
+# Failed fetches are cached for the same TTL so requests queued behind a slow or failing
+# Supabase call reuse its error instead of retrying one after another under the lock.
+# Writes bump the generation so a fetch that raced an insert is not stored. Invalidation is
+# per process: other gunicorn workers may serve the previous list until their entry expires.
+_CACHE_TTL = float(os.getenv("MOVIES_CACHE_TTL", "2"))
+_cache_lock = threading.Lock()
+_cache = {"expires": 0.0, "body": None, "error": None, "generation": 0}
+
+
+def _cached_movies():
+    """Return the cached JSON body if it has not expired, else None.
+
+    Aborts with the cached error status and message if the last fetch failed.
+    """
+    if time.monotonic() < _cache["expires"]:
+        error = _cache["error"]
+        if error is not None:
+            abort(error[0], message=error[1])
+        return _cache["body"]
+    return None
+
+
+def _invalidate_movies_cache() -> None:
+    _cache["generation"] += 1
+    _cache["expires"] = 0.0
+
+
+def _fetch_movies() -> list:
+    """Fetch all movies from Supabase, aborting with 500 on failure."""
+    try:
+        supabase = get_supabase()
+    except RuntimeError as e:
+        _logger.error(
+            "movies_get_supabase_init_error: %s", e,
+            extra={"event": "movies_get_supabase_init_error"},
+        )
+        abort(500, message=str(e))
+
+    try:
+        # Use '*' to avoid errors if optional columns (e.g., photo_url) are absent
+        res = supabase.table("movies").select("*").execute()
+        data = getattr(res, "data", None)
+        if data is None:
+            data = []
+        _logger.info(
+            "movies_get_success count=%d", len(data),
+            extra={"event": "movies_get_success", "context": {"count": len(data)}},
+        )
+        return data
+    except Exception as exc:
+        _logger.error(
+            "movies_get_failure: %s", exc,
+            extra={"event": "movies_get_failure"},
+            exc_info=True,
+        )
+        abort(500, message="Failed to fetch movies")
+
+
+def _load_movies() -> bytes:
+    """Return the movies list as a JSON body, serving from the TTL cache and refilling it once on expiry.
+
+    Rows come from Postgres already typed, so they are encoded as-is rather than re-dumped
+    through MovieSchema. A body served from the cache is recorded on ``g`` so Flask-Compress
+    can reuse its compressed form (see compress_cache_key).
+    """
+    if _CACHE_TTL <= 0:
+        return msgspec.json.encode(_fetch_movies())
+    body = _cached_movies()
+    if body is None:
+        with _cache_lock:
+            # Another request may have refilled the cache while this one waited
+            body = _cached_movies()
+            if body is None:
+                generation = _cache["generation"]
+                try:
+                    body = msgspec.json.encode(_fetch_movies())
+                except HTTPException as exc:
+                    if generation == _cache["generation"]:
+                        _cache["error"] = (exc.code, getattr(exc, "data", {}).get("message"))
+                        _cache["expires"] = time.monotonic() + _CACHE_TTL
+                    raise
+                if generation != _cache["generation"]:
+                    return body
+                _cache["body"] = body
+                _cache["error"] = None
+                _cache["expires"] = time.monotonic() + _CACHE_TTL
+    g.movies_cache_body = body
+    return body
+
+
+class CompressedMoviesCache:
+    """Flask-Compress cache backend holding the compressed form of the cached movies list.
+
+    Entries are keyed by the cached body object itself, which is replaced on every refill
+    and invalidation, so a compressed body is reused only while that exact list is served.
+    """
+
+    def __init__(self):
+        self._entry = (None, None)
+
+    def get(self, key):
+        cached_key, value = self._entry
+        if key is not None and key is cached_key:
+            return value
+        return None
+
+    def set(self, key, value):
+        if key is not None:
+            self._entry = (key, value)
+
+
+def compress_cache_key(request):
+    """Flask-Compress cache key: the cached movies body served for this request, if any."""
+    return g.get("movies_cache_body")
+
+
 @blp.route("/movies")
 class MoviesList(MethodView):
     # PUBLIC_INTERFACE
-    @blp.response(200, MovieSchema(many=True), description="List all movies")
+    # The schema documents the response; returning a Response bypasses its serialization
+    @blp.response(200, _MOVIE_LIST_SCHEMA, description="List all movies")
     def get(self):
         """Fetch a list of movies from the 'movies' table in Supabase.
 
@@ -46,46 +241,30 @@ class MoviesList(MethodView):
             200: JSON array of movie records.
             500: JSON error if configuration or database fetch fails.
         """
-        current_app.logger.info(json.dumps({"event": "movies_get_start"}))
-        try:
-            supabase = get_supabase()
-        except RuntimeError as e:
-            current_app.logger.error(json.dumps({
-                "event": "movies_get_supabase_init_error",
-                "message": str(e)
-            }))
-            blp.abort(500, message=str(e))
-
-        try:
-            # Use '*' to avoid errors if optional columns (e.g., photo_url) are absent
-            res = supabase.table("movies").select("*").execute()
-            data = getattr(res, "data", None)
-            if data is None:
-                data = []
-            current_app.logger.info(json.dumps({
-                "event": "movies_get_success",
-                "count": len(data)
-            }))
-            return data
-        except Exception as exc:
-            current_app.logger.exception("Failed to fetch movies from Supabase")
-            current_app.logger.error(json.dumps({
-                "event": "movies_get_failure",
-                "message": str(exc)
-            }))
-            blp.abort(500, message="Failed to fetch movies")
+        _logger.info("movies_get_start", extra={"event": "movies_get_start"})
+        return Response(_load_movies(), status=200, mimetype="application/json")
 
     # PUBLIC_INTERFACE
-    @blp.arguments(
-        MovieCreateSchema,
-        example={
-            "title": "Inception",
-            "year": 2010,
-            "overview": "A mind-bending heist.",
-            "photo_url": "https://image.tmdb.org/t/p/w500/example.jpg",
-        },
+    @blp.doc(
+        requestBody={
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": MovieCreateSchema,
+                    "example": {
+                        "title": "Inception",
+                        "year": 2010,
+                        "overview": "A mind-bending heist.",
+                        "photo_url": "https://image.tmdb.org/t/p/w500/example.jpg",
+                    },
+                }
+            },
+        }
     )
+    @blp.alt_response(422, response="UNPROCESSABLE_ENTITY")
+    # MovieSchema documents the response; the created row is returned pre-encoded
     @blp.response(201, MovieSchema, description="Create a new movie")
+    @use_msgspec(MovieCreate)
     def post(self, new_movie):
         """Create a new movie record in the 'movies' table.
 
@@ -98,89 +277,99 @@ class MoviesList(MethodView):
         Returns:
             201: The newly created movie record as JSON.
             400: If validation fails.
-            422: If JSON body validation fails (marshmallow).
+            422: If JSON body validation fails (msgspec).
             500: If configuration or database operation fails.
         """
         # Title is required; safeguard beyond schema
         title = (new_movie.get("title") or "").strip()
         if not title:
-            current_app.logger.warning(json.dumps({
-                "event": "movies_post_validation_error",
-                "message": "title is empty after trimming"
-            }))
-            blp.abort(400, message="Field 'title' is required and cannot be empty.")
+            _logger.warning(
+                "movies_post_validation_error: title is empty after trimming",
+                extra={"event": "movies_post_validation_error"},
+            )
+            abort(400, message="Field 'title' is required and cannot be empty.")
 
-        # photo_url is optional; if provided, ensure it's a string (marshmallow already deserializes to str)
+        # photo_url is optional; if provided, ensure it's a string (msgspec already validates it as str)
         # Keeping an explicit check for clarity and to align with the requirement.
         photo_url = new_movie.get("photo_url", None)
         if photo_url is not None and not isinstance(photo_url, str):
-            current_app.logger.warning(json.dumps({
-                "event": "movies_post_validation_error",
-                "message": "photo_url must be a string when provided"
-            }))
-            blp.abort(400, message="Field 'photo_url' must be a string if provided.")
+            _logger.warning(
+                "movies_post_validation_error: photo_url must be a string when provided",
+                extra={"event": "movies_post_validation_error"},
+            )
+            abort(400, message="Field 'photo_url' must be a string if provided.")
 
         # Log attempt with minimal context (no secret values)
-        current_app.logger.info(json.dumps({
-            "event": "movies_post_start",
-            "payload_keys": sorted(list(new_movie.keys()))
-        }))
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info(
+                "movies_post_start",
+                extra={
+                    "event": "movies_post_start",
+                    "context": {"payload_keys": tuple(k for k in _MOVIE_CREATE_KEYS if k in new_movie)},
+                },
+            )
 
         try:
             supabase = get_supabase()
         except RuntimeError as e:
-            current_app.logger.error(json.dumps({
-                "event": "movies_post_supabase_init_error",
-                "message": str(e)
-            }))
-            blp.abort(500, message=str(e))
+            _logger.error(
+                "movies_post_supabase_init_error: %s", e,
+                extra={"event": "movies_post_supabase_init_error"},
+            )
+            abort(500, message=str(e))
 
         def _insert(payload: dict):
             res_local = supabase.table("movies").insert(payload).execute()
             data_local = getattr(res_local, "data", None)
             if not data_local:
-                current_app.logger.error(json.dumps({
-                    "event": "movies_post_insert_no_data"
-                }))
-                blp.abort(500, message="Insert failed: no data returned from Supabase")
+                _logger.error(
+                    "movies_post_insert_no_data",
+                    extra={"event": "movies_post_insert_no_data"},
+                )
+                abort(500, message="Insert failed: no data returned from Supabase")
+            _invalidate_movies_cache()
             return data_local[0]
 
         # First attempt
         try:
             created = _insert(new_movie)
-            current_app.logger.info(json.dumps({
-                "event": "movies_post_success",
-                "id": created.get("id")
-            }))
-            return created
+            _logger.info(
+                "movies_post_success id=%s", created.get("id"),
+                extra={"event": "movies_post_success", "context": {"id": created.get("id")}},
+            )
+            return Response(msgspec.json.encode(created), status=201, mimetype="application/json")
         except Exception as exc:
             # On error, if photo_url was provided, attempt to retry without it
             err_text = str(exc)
-            current_app.logger.exception("Failed to insert movie into Supabase")
-            current_app.logger.warning(json.dumps({
-                "event": "movies_post_insert_error",
-                "message": err_text,
-                "had_photo_url": "photo_url" in new_movie
-            }))
-
-            if "photo_url" in new_movie and (
-                "column" in err_text.lower()
-                or "unknown" in err_text.lower()
-                or "invalid input" in err_text.lower()
-                or "does not exist" in err_text.lower()
-                or "undefined" in err_text.lower()
-            ):
+            _logger.error(
+                "movies_post_insert_error: %s", err_text,
+                extra={
+                    "event": "movies_post_insert_error",
+                    "context": {"had_photo_url": "photo_url" in new_movie},
+                },
+                exc_info=True,
+            )
+
+            if "photo_url" in new_movie and _MISSING_COLUMN_RE.search(err_text):
                 # Retry without photo_url in case the column is not present in the DB
-                safe_payload = {k: v for k, v in new_movie.items() if k != "photo_url"}
+                safe_payload = dict(new_movie)
+                safe_payload.pop("photo_url", None)
                 try:
                     created = _insert(safe_payload)
-                    current_app.logger.info(json.dumps({
-                        "event": "movies_post_success_without_photo_url",
-                        "id": created.get("id")
-                    }))
-                    return created
+                    _logger.info(
+                        "movies_post_success_without_photo_url id=%s", created.get("id"),
+                        extra={
+                            "event": "movies_post_success_without_photo_url",
+                            "context": {"id": created.get("id")},
+                        },
+                    )
+                    return Response(msgspec.json.encode(created), status=201, mimetype="application/json")
                 except Exception:
-                    current_app.logger.exception("Retry insert without photo_url failed")
-                    blp.abort(500, message="Failed to create movie")
+                    _logger.error(
+                        "movies_post_retry_insert_error",
+                        extra={"event": "movies_post_retry_insert_error"},
+                        exc_info=True,
+                    )
+                    abort(500, message="Failed to create movie")
             else:
-                blp.abort(500, message="Failed to create movie")
+                abort(500, message="Failed to create movie")
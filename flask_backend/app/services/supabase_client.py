@@ -1,13 +1,18 @@
 """Supabase client service for server-side usage.
 
-This module lazily initializes a singleton Supabase client using the environment
-variables SUPABASE_URL and SUPABASE_SERVICE_KEY. It is intended for server-side
-use only; do not expose keys to the frontend.
+This module initializes a singleton Supabase client using the environment
+variables SUPABASE_URL and SUPABASE_SERVICE_KEY. The app creates it eagerly at
+startup; if that fails (e.g. missing configuration) it is retried lazily on use.
+It is intended for server-side use only; do not expose keys to the frontend.
 
 Environment variables required:
 - SUPABASE_URL: Base URL of your Supabase project.
 - SUPABASE_SERVICE_KEY: Service role key for privileged server-side access.
 
+Optional:
+- SUPABASE_TIMEOUT: Seconds before a database (PostgREST) request times out, default 10.
+  Keeps a slow Supabase from holding a worker thread well past the gunicorn timeout.
+
 Usage:
     from app.services.supabase_client import get_supabase
 
@@ -17,19 +22,24 @@ Usage:
 import os
 import threading
 import logging
-import json
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from supabase import Client, create_client
+# supabase pulls in httpx, postgrest, gotrue, storage3 and realtime; it is imported when the
+# client is first created so tooling that only imports the app (e.g. generate_openapi.py)
+# does not pay for it.
+if TYPE_CHECKING:
+    from supabase import Client
 
-# Module-level lock and client for thread-safe lazy initialization
+# Module-level lock and client for thread-safe one-time initialization
 _client_lock = threading.Lock()
-_client: Optional[Client] = None
+_client: Optional["Client"] = None
 
 _logger = logging.getLogger("app.supabase")
 
+_POSTGREST_TIMEOUT = float(os.getenv("SUPABASE_TIMEOUT", "10"))
+
 
-def _create_client() -> Client:
+def _create_client() -> "Client":
     """Create a new Supabase client using environment variables.
 
     Raises:
@@ -38,11 +48,13 @@ def _create_client() -> Client:
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_SERVICE_KEY")
 
-    _logger.info(json.dumps({
-        "event": "supabase_create_client_attempt",
-        "has_url": bool(url),
-        "has_service_key": bool(key),
-    }))
+    _logger.info(
+        "supabase_create_client_attempt",
+        extra={
+            "event": "supabase_create_client_attempt",
+            "context": {"has_url": bool(url), "has_service_key": bool(key)},
+        },
+    )
 
     if not url or not key:
         missing = []
@@ -50,28 +62,36 @@ def _create_client() -> Client:
             missing.append("SUPABASE_URL")
         if not key:
             missing.append("SUPABASE_SERVICE_KEY")
-        _logger.error(json.dumps({
-            "event": "supabase_missing_configuration",
-            "missing": missing,
-        }))
+        _logger.error(
+            "supabase_missing_configuration: %s", ", ".join(missing),
+            extra={"event": "supabase_missing_configuration", "context": {"missing": missing}},
+        )
         raise RuntimeError(
             f"Missing required Supabase configuration: {', '.join(missing)}. "
             "Ensure these are set on the server environment (not exposed to the frontend)."
         )
 
+    from supabase import create_client
+    from supabase.client import ClientOptions
+
     try:
-        client = create_client(url, key)
-        _logger.info(json.dumps({"event": "supabase_client_initialized"}))
+        # One client per process: its HTTP session and connection pool are reused across requests
+        client = create_client(url, key, options=ClientOptions(postgrest_client_timeout=_POSTGREST_TIMEOUT))
+        _logger.info("supabase_client_initialized", extra={"event": "supabase_client_initialized"})
         return client
     except Exception as exc:
         # Do not expose secret values in logs; record structured exception and raise a safe message
-        _logger.exception("Supabase client creation failed")
+        _logger.error(
+            "supabase_client_init_failed",
+            extra={"event": "supabase_client_init_failed"},
+            exc_info=True,
+        )
         raise RuntimeError("Failed to initialize Supabase client") from exc
 
 
 # PUBLIC_INTERFACE
-def get_supabase() -> Client:
-    """Return a lazily-initialized singleton Supabase client.
+def get_supabase() -> "Client":
+    """Return the singleton Supabase client, creating it on first use if needed.
 
     Returns:
         Client: Supabase client instance.
@@ -81,10 +101,13 @@ def get_supabase() -> Client:
 
     Notes:
         This function is safe to call from multiple threads; the client is initialized once.
+        Once initialized (normally at app startup), this is a single module-global read.
     """
     global _client
-    if _client is None:
-        with _client_lock:
-            if _client is None:
-                _client = _create_client()
+    client = _client
+    if client is not None:
+        return client
+    with _client_lock:
+        if _client is None:
+            _client = _create_client()
     return _client
@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app import app as flask_app
+from app.routes import movies
+
+
+class FakeSupabase:
+    """Minimal stand-in for the Supabase client's table().select()/insert() ... execute() chain."""
+
+    def __init__(self, rows=None):
+        self.rows = list(rows or [])
+        self.inserted = []
+        self._result = []
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        self._result = self.rows
+        return self
+
+    def insert(self, payload):
+        self.inserted.append(payload)
+        self._result = [dict(payload, id=len(self.inserted))]
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=self._result)
+
+
+@pytest.fixture
+def client():
+    flask_app.config["TESTING"] = True
+    with flask_app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    fake = FakeSupabase()
+    monkeypatch.setattr(movies, "get_supabase", lambda: fake)
+    movies._invalidate_movies_cache()
+    yield fake
+    movies._invalidate_movies_cache()
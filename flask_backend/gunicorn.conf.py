@@ -0,0 +1,22 @@
+"""Gunicorn settings for serving the Flask app with preforked workers.
+
+Usage (from flask_backend/):
+    gunicorn -c gunicorn.conf.py app:app
+
+Environment variables:
+- FLASK_HOST / FLASK_PORT (or PORT): bind address, defaults to 0.0.0.0:3001.
+- WEB_CONCURRENCY: number of worker processes, defaults to the CPU count.
+- GUNICORN_THREADS: threads per worker for I/O-bound Supabase calls, defaults to 8.
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('PORT', os.getenv('FLASK_PORT', '3001'))}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+timeout = 30
+
+# Import the app once in the master so forked workers share the Supabase client
+# and schemas copy-on-write instead of rebuilding them per worker.
+preload_app = True
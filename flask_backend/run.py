@@ -1,4 +1,20 @@
-from app import app
+import os
+import sys
 
 if __name__ == "__main__":
-    app.run()
+    # Serve with preforked gunicorn workers rather than the single-process dev server.
+    # The app is not imported here; gunicorn loads it itself, so nothing is initialized twice.
+    # Running gunicorn through this interpreter works without the venv's bin on PATH.
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    os.execv(
+        sys.executable,
+        [
+            sys.executable, "-m", "gunicorn",
+            "--chdir", base_dir,
+            "-c", os.path.join(base_dir, "gunicorn.conf.py"),
+            "app:app",
+        ],
+    )
+else:
+    # Expose the app for WSGI servers pointed at run:app
+    from app import app  # noqa: F401
@@ -0,0 +1,51 @@
+import pytest
+
+ALLOWED_ORIGIN = "http://localhost:3000"
+
+
+@pytest.mark.parametrize(
+    "origin",
+    [
+        ALLOWED_ORIGIN,
+        # Configured with a trailing slash; browsers send the origin without one
+        "https://kavia-bootcamp-movie-application.kavia.app",
+    ],
+)
+def test_allowed_origin_is_echoed(client, origin):
+    resp = client.get("/api/hello", headers={"Origin": origin})
+
+    assert resp.headers["Access-Control-Allow-Origin"] == origin
+    assert "Origin" in resp.headers["Vary"]
+
+
+def test_disallowed_origin_gets_no_cors_headers(client):
+    resp = client.get("/api/hello", headers={"Origin": "https://evil.example.com"})
+
+    assert "Access-Control-Allow-Origin" not in resp.headers
+    assert "Access-Control-Allow-Methods" not in resp.headers
+
+
+def test_preflight_returns_fixed_methods_and_headers(client):
+    resp = client.options(
+        "/api/movies",
+        headers={
+            "Origin": ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "Content-Type",
+        },
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["Access-Control-Allow-Origin"] == ALLOWED_ORIGIN
+    assert resp.headers["Access-Control-Allow-Methods"] == "GET, POST, PUT, DELETE, OPTIONS, PATCH"
+    assert resp.headers["Access-Control-Allow-Headers"] == "Content-Type, Authorization"
+
+
+def test_vary_keeps_origin_alongside_compression(client, fake_supabase):
+    fake_supabase.rows = [{"id": i, "title": f"Movie {i}", "overview": "x" * 40} for i in range(50)]
+
+    resp = client.get("/api/movies", headers={"Origin": ALLOWED_ORIGIN, "Accept-Encoding": "gzip"})
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    vary = {value.strip() for value in resp.headers["Vary"].split(",")}
+    assert {"Origin", "Accept-Encoding"} <= vary
@@ -0,0 +1,75 @@
+import gzip
+import json
+
+import pytest
+from flask_compress import Compress
+
+from app.routes import movies
+
+
+@pytest.mark.parametrize(
+    "kwargs, field",
+    [
+        ({"json": {"year": 2010}}, "title"),
+        ({"json": {"title": ""}}, "title"),
+        ({"json": {"title": "Inception", "year": "soon"}}, "year"),
+        ({"json": {"title": "Inception", "year": "null"}}, "year"),
+        ({"json": {"title": "Inception", "year": "1e3"}}, "year"),
+        ({"json": {"title": "Inception", "rating": 5}}, "rating"),
+        ({"data": "{not json", "content_type": "application/json"}, "_schema"),
+        ({"data": "title=Inception", "content_type": "text/plain"}, "_schema"),
+    ],
+)
+def test_post_movie_invalid_body_returns_422(client, kwargs, field):
+    resp = client.post("/api/movies", **kwargs)
+
+    assert resp.status_code == 422
+    assert field in resp.get_json()["errors"]["json"]
+
+
+@pytest.mark.parametrize("year, expected", [(2010, 2010), ("2010", 2010), (None, None)])
+def test_post_movie_accepts_integer_year_values(client, fake_supabase, year, expected):
+    resp = client.post("/api/movies", json={"title": "Inception", "year": year})
+
+    assert resp.status_code == 201
+    assert fake_supabase.inserted == [{"title": "Inception", "year": expected}]
+
+
+def test_get_movies_failure_is_cached_for_ttl(client, monkeypatch):
+    calls = []
+
+    def failing_get_supabase():
+        calls.append(1)
+        raise RuntimeError("Missing required Supabase configuration")
+
+    monkeypatch.setattr(movies, "get_supabase", failing_get_supabase)
+    monkeypatch.setattr(movies, "_CACHE_TTL", 60.0)
+    monkeypatch.setattr(movies, "_cache", {"expires": 0.0, "body": None, "error": None, "generation": 0})
+
+    first = client.get("/api/movies")
+    second = client.get("/api/movies")
+
+    assert first.status_code == second.status_code == 500
+    assert second.get_json()["message"] == "Missing required Supabase configuration"
+    assert len(calls) == 1
+
+
+def test_get_movies_cache_hit_reuses_compressed_body(client, fake_supabase, monkeypatch):
+    fake_supabase.rows = [{"id": i, "title": f"Movie {i}", "year": 2000 + i, "overview": "x" * 40} for i in range(50)]
+    monkeypatch.setattr(movies, "_CACHE_TTL", 60.0)
+    compress_calls = []
+    original_compress = Compress.compress
+
+    def counting_compress(self, *args, **kwargs):
+        compress_calls.append(1)
+        return original_compress(self, *args, **kwargs)
+
+    monkeypatch.setattr(Compress, "compress", counting_compress)
+
+    client.get("/api/movies", headers={"Accept-Encoding": "gzip"})
+    resp = client.get("/api/movies", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(resp.get_data())) == fake_supabase.rows
+    assert len(compress_calls) == 1